@@ -0,0 +1,803 @@
+#!/usr/bin/env python3
+"""
+Kubernetes deployment manager for the arbitrage stack.
+
+Drives rolling, canary, and blue/green rollouts against the cluster using
+the in-process Kubernetes Python client. A single authenticated ApiClient
+is created at module load and reused for every call, so kubeconfig parsing
+and the TLS handshake are paid once per process instead of once per
+operation. When the `kubernetes` package is not installed, every operation
+falls back to shelling out to `kubectl`.
+
+Usage:
+    python deployment_manager.py --deployment app --image repo/app:v2 \
+        --strategy canary --replicas 6
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from logging.handlers import MemoryHandler
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from kubernetes import client, config, watch
+    from kubernetes.client.exceptions import ApiException
+    from urllib3.exceptions import ProtocolError
+
+    _HAS_K8S = True
+except ImportError:
+    _HAS_K8S = False
+
+try:
+    from kubernetes_asyncio import client as aio_client, config as aio_config
+
+    _HAS_ASYNC = True
+except ImportError:
+    _HAS_ASYNC = False
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize a patch body with orjson's C encoder."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _dumps(obj) -> str:
+        """Serialize a patch body with the stdlib encoder."""
+        return json.dumps(obj, separators=(",", ":"))
+
+_api_client: Optional["client.ApiClient"] = None
+apps: Optional["client.AppsV1Api"] = None
+core: Optional["client.CoreV1Api"] = None
+
+
+def _ensure_client() -> None:
+    """Parse kubeconfig and build the shared ApiClient on first use.
+
+    The client (and the TLS session behind it) is cached for the life of
+    the process, so repeated deploys — including daemon mode — pay for
+    config loading and authentication exactly once.
+    """
+    global _api_client, apps, core
+    if not _HAS_K8S or _api_client is not None:
+        return
+    try:
+        config.load_incluster_config()
+    except Exception:
+        config.load_kube_config()
+    _api_client = client.ApiClient()
+    apps = client.AppsV1Api(_api_client)
+    core = client.CoreV1Api(_api_client)
+
+
+
+log = logging.getLogger("deploy")
+if not log.handlers:
+    # Buffer progress lines in memory and emit them once per phase; errors
+    # flush immediately. Turns a write syscall per message into one per
+    # deploy phase.
+    log.addHandler(
+        MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=logging.StreamHandler(),
+        )
+    )
+    log.setLevel(logging.INFO)
+
+
+def _flush_log() -> None:
+    for handler in log.handlers:
+        handler.flush()
+
+
+class Strategy(Enum):
+    ROLLING = "rolling"
+    CANARY = "canary"
+    BLUE_GREEN = "blue-green"
+
+
+@dataclass
+class DeploymentConfig:
+    deployment: str
+    image: str
+    namespace: str = "default"
+    replicas: int = 3
+    strategy: Strategy = Strategy.ROLLING
+    timeout_seconds: int = 300
+    bake_seconds: int = 60
+    ready_timeout: int = 120
+    container: str = "app"
+    canary_steps: List[int] = field(default_factory=lambda: [10, 25, 50, 75, 100])
+
+
+def run_kubectl(args: List[str]) -> subprocess.CompletedProcess:
+    """Fallback path: run a kubectl subcommand and capture its output."""
+    return subprocess.run(
+        ["kubectl", *args], capture_output=True, text=True, check=False
+    )
+
+
+def run_kubectl_parallel(
+    commands: List[List[str]],
+) -> List[subprocess.CompletedProcess]:
+    """Run independent kubectl commands concurrently and wait for all.
+
+    Forking the processes in parallel means N independent writes cost one
+    fork's worth of wall clock instead of N; the thread pool keeps output
+    capture and exception propagation identical to run_kubectl.
+    """
+    with ThreadPoolExecutor(max_workers=len(commands)) as ex:
+        return list(ex.map(run_kubectl, commands))
+
+
+_HEALTH_TTL_SECONDS = 2.0
+_health_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+
+
+def _invalidate_health(namespace: str, name: str) -> None:
+    _health_cache.pop((namespace, name), None)
+
+
+def check_deployment_health(cfg: DeploymentConfig, name: Optional[str] = None) -> bool:
+    """Return True when the deployment has all desired replicas available.
+
+    Results are memoized for a short TTL so probes in tight loops coalesce
+    into one API round-trip; any scale or apply mutation invalidates the
+    entry for its deployment.
+    """
+    name = name or cfg.deployment
+    key = (cfg.namespace, name)
+    cached = _health_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _HEALTH_TTL_SECONDS:
+        return cached[1]
+    if _HAS_K8S:
+        _ensure_client()
+        status = apps.read_namespaced_deployment_status(name, cfg.namespace)
+        available = status.status.available_replicas or 0
+        desired = status.spec.replicas or 0
+    else:
+        result = run_kubectl(
+            [
+                "get",
+                "deployment",
+                name,
+                "-n",
+                cfg.namespace,
+                "-o",
+                "jsonpath={.status.availableReplicas}/{.spec.replicas}",
+            ]
+        )
+        if result.returncode != 0:
+            return False
+        raw_available, _, raw_desired = result.stdout.partition("/")
+        available = int(raw_available or 0)
+        desired = int(raw_desired or 0)
+    healthy = desired > 0 and available >= desired
+    _health_cache[key] = (time.monotonic(), healthy)
+    return healthy
+
+
+def set_image(cfg: DeploymentConfig, name: Optional[str] = None) -> None:
+    """Point the deployment's container at cfg.image."""
+    name = name or cfg.deployment
+    if _HAS_K8S:
+        _ensure_client()
+        body = {
+            "spec": {
+                "template": {
+                    "spec": {
+                        "containers": [{"name": cfg.container, "image": cfg.image}]
+                    }
+                }
+            }
+        }
+        apps.patch_namespaced_deployment(name, cfg.namespace, body)
+    else:
+        run_kubectl(
+            [
+                "set",
+                "image",
+                f"deployment/{name}",
+                f"{cfg.container}={cfg.image}",
+                "-n",
+                cfg.namespace,
+            ]
+        )
+
+
+def scale(cfg: DeploymentConfig, name: str, replicas: int) -> None:
+    """Scale a deployment to the given replica count."""
+    if _HAS_K8S:
+        _ensure_client()
+        apps.patch_namespaced_deployment_scale(
+            name, cfg.namespace, {"spec": {"replicas": replicas}}
+        )
+    else:
+        run_kubectl(
+            ["scale", f"deployment/{name}", f"--replicas={replicas}", "-n", cfg.namespace]
+        )
+    _invalidate_health(cfg.namespace, name)
+
+
+class RolloutStatus(Enum):
+    IN_PROGRESS = "InProgress"
+    CURRENT = "Current"
+    FAILED = "Failed"
+
+
+def compute_status(dep) -> RolloutStatus:
+    """kstatus-style rollout status for a Deployment object.
+
+    Pure function over the object's generation, replica counters, and
+    conditions, following the order sigs.k8s.io/cli-utils uses: stale
+    observedGeneration and lagging replica counts mean InProgress, an
+    exceeded progress deadline means Failed, everything caught up means
+    Current.
+    """
+    status = dep.status
+    if (status.observed_generation or 0) < (dep.metadata.generation or 0):
+        return RolloutStatus.IN_PROGRESS
+    for condition in status.conditions or []:
+        if (
+            condition.type == "Progressing"
+            and condition.reason == "ProgressDeadlineExceeded"
+        ):
+            return RolloutStatus.FAILED
+    desired = dep.spec.replicas or 0
+    updated = status.updated_replicas or 0
+    if updated < desired:
+        return RolloutStatus.IN_PROGRESS
+    if (status.replicas or 0) > updated:
+        # Replicas from the previous generation still terminating.
+        return RolloutStatus.IN_PROGRESS
+    if (status.available_replicas or 0) < updated:
+        return RolloutStatus.IN_PROGRESS
+    if (status.ready_replicas or 0) < desired:
+        return RolloutStatus.IN_PROGRESS
+    return RolloutStatus.CURRENT
+
+
+def wait_for_rollout(cfg: DeploymentConfig, name: Optional[str] = None) -> bool:
+    """Block until the rollout completes or times out.
+
+    Watches the deployment instead of polling, so completion is observed
+    the moment the API server emits the event. The watch is re-established
+    every 60 s at most, which doubles as a full-list reconciliation in case
+    a watch connection was silently dropped by an idle LB.
+    """
+    name = name or cfg.deployment
+    if not _HAS_K8S:
+        # Stream the rollout log line by line instead of buffering it all;
+        # bail out the moment kubectl reports success rather than waiting
+        # for the process to wind down on its own.
+        proc = subprocess.Popen(
+            [
+                "kubectl",
+                "rollout",
+                "status",
+                f"deployment/{name}",
+                "-n",
+                cfg.namespace,
+                f"--timeout={cfg.timeout_seconds}s",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            preexec_fn=os.setsid,
+        )
+        try:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                if "successfully rolled out" in line:
+                    # kubectl runs in its own session (os.setsid above), so
+                    # signal the whole process group, not just the direct
+                    # child.
+                    os.killpg(proc.pid, signal.SIGTERM)
+                    return True
+        finally:
+            proc.wait()
+        return proc.returncode == 0
+
+    _ensure_client()
+    deadline = time.monotonic() + cfg.timeout_seconds
+    while time.monotonic() < deadline:
+        # The initial list the watch performs re-checks current state, so a
+        # completion missed during a disconnect is picked up on reconnect.
+        remaining = deadline - time.monotonic()
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                apps.list_namespaced_deployment,
+                namespace=cfg.namespace,
+                field_selector=f"metadata.name={name}",
+                timeout_seconds=int(min(60, max(1, remaining))),
+            ):
+                result = compute_status(event["object"])
+                if result is RolloutStatus.CURRENT:
+                    w.stop()
+                    return True
+                if result is RolloutStatus.FAILED:
+                    w.stop()
+                    log.warning(f"{name} exceeded its progress deadline")
+                    return False
+        except (ApiException, ProtocolError) as exc:
+            # Abrupt disconnect (LB reset, expired resourceVersion); the
+            # reconnect's fresh list re-checks state, so nothing is lost.
+            log.warning(f"watch on {name} interrupted: {exc}; reconnecting")
+            continue
+    return False
+
+
+def deploy_rolling(cfg: DeploymentConfig) -> bool:
+    log.info(f"Rolling deploy of {cfg.image} to {cfg.deployment}")
+    set_image(cfg)
+    if not wait_for_rollout(cfg):
+        log.warning("Rollout did not complete in time")
+        return False
+    healthy = check_deployment_health(cfg)
+    log.info("Deploy succeeded" if healthy else "Deploy finished but health check failed")
+    return healthy
+
+
+def _apply_body(
+    cfg: DeploymentConfig, name: str, replicas: int, image: Optional[str] = None
+) -> dict:
+    """Server-Side Apply body carrying replicas (and optionally the image)."""
+    spec = {"replicas": replicas}
+    if image is not None:
+        spec["template"] = {
+            "spec": {"containers": [{"name": cfg.container, "image": image}]}
+        }
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": name, "namespace": cfg.namespace},
+        "spec": spec,
+    }
+
+
+def apply_deployment(
+    cfg: DeploymentConfig, name: str, replicas: int, image: Optional[str] = None
+) -> None:
+    """Apply replicas (and optionally the image) in one Server-Side Apply."""
+    _ensure_client()
+    apps.patch_namespaced_deployment(
+        name,
+        cfg.namespace,
+        _apply_body(cfg, name, replicas, image),
+        field_manager="deployment_manager",
+        force=True,
+        _content_type="application/apply-patch+yaml",
+    )
+    _invalidate_health(cfg.namespace, name)
+
+
+def wait_until_available(
+    cfg: DeploymentConfig, name: str, desired: int, timeout: int
+) -> float:
+    """Watch a deployment until `desired` replicas are available.
+
+    Returns the seconds spent waiting, so callers can credit ready time
+    against a fixed bake window. Slow rollouts are still bounded by the
+    deployment's own progressDeadlineSeconds plus `timeout` here.
+    """
+    _ensure_client()
+    start = time.monotonic()
+    deadline = start + timeout
+    while time.monotonic() < deadline:
+        remaining = deadline - time.monotonic()
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                apps.list_namespaced_deployment,
+                namespace=cfg.namespace,
+                field_selector=f"metadata.name={name}",
+                timeout_seconds=int(min(60, max(1, remaining))),
+            ):
+                if (event["object"].status.available_replicas or 0) >= desired:
+                    w.stop()
+                    return time.monotonic() - start
+        except (ApiException, ProtocolError) as exc:
+            log.warning(f"watch on {name} interrupted: {exc}; reconnecting")
+            continue
+    return time.monotonic() - start
+
+
+def _canary_schedule(cfg: DeploymentConfig) -> List[Tuple[int, int]]:
+    """Precompute the (canary, stable) replica counts for every step.
+
+    Doing this up front keeps the step loop a pure I/O driver and lets a
+    bad step list (e.g. a weight over 100) fail before the first API call.
+    """
+    schedule = []
+    for weight in cfg.canary_steps:
+        canary_replicas = max(1, cfg.replicas * weight // 100)
+        stable_replicas = cfg.replicas - canary_replicas
+        if stable_replicas < 0:
+            raise ValueError(
+                f"canary step {weight}% yields {canary_replicas} replicas, "
+                f"more than the configured total of {cfg.replicas}"
+            )
+        schedule.append((canary_replicas, stable_replicas))
+    return schedule
+
+
+async def _deploy_canary_async(cfg: DeploymentConfig) -> bool:
+    """Canary driver that overlaps the independent canary/stable patches.
+
+    Runs the whole step loop inside one kubernetes_asyncio ApiClient so the
+    aiohttp session (and its TLS handshake) is reused across every call.
+    Readiness waits and health probes go through the sync client helpers in
+    a worker thread.
+    """
+    canary = f"{cfg.deployment}-canary"
+
+    async def apply_async(api, name, replicas, image=None):
+        await api.patch_namespaced_deployment(
+            name,
+            cfg.namespace,
+            _apply_body(cfg, name, replicas, image),
+            field_manager="deployment_manager",
+            force=True,
+            _content_type="application/apply-patch+yaml",
+        )
+        _invalidate_health(cfg.namespace, name)
+
+    try:
+        aio_config.load_incluster_config()
+    except Exception:
+        await aio_config.load_kube_config()
+    async with aio_client.ApiClient() as api_client:
+        aio_apps = aio_client.AppsV1Api(api_client)
+        for weight, (canary_replicas, stable_replicas) in zip(
+            cfg.canary_steps, _canary_schedule(cfg)
+        ):
+            log.info(f"Step {weight}%: canary={canary_replicas} stable={stable_replicas}")
+            await asyncio.gather(
+                apply_async(aio_apps, canary, canary_replicas, cfg.image),
+                apply_async(aio_apps, cfg.deployment, stable_replicas),
+            )
+            elapsed = await asyncio.to_thread(
+                wait_until_available, cfg, canary, canary_replicas, cfg.ready_timeout
+            )
+            await asyncio.sleep(max(0.0, cfg.bake_seconds - elapsed))
+            if not await asyncio.to_thread(check_deployment_health, cfg, canary):
+                log.warning(f"Canary unhealthy at {weight}%, rolling back")
+                await asyncio.gather(
+                    apply_async(aio_apps, canary, 0),
+                    apply_async(aio_apps, cfg.deployment, cfg.replicas),
+                )
+                return False
+        # Same ordering as the sync driver: stable must be fully rolled out
+        # on the new image before the canary stops serving.
+        await apply_async(aio_apps, cfg.deployment, cfg.replicas, cfg.image)
+        if not await asyncio.to_thread(wait_for_rollout, cfg):
+            log.warning(
+                "Stable rollout failed after promotion; leaving canary serving"
+            )
+            return False
+        await apply_async(aio_apps, canary, 0)
+        healthy = await asyncio.to_thread(check_deployment_health, cfg)
+        if healthy:
+            log.info("Canary promoted to 100%")
+        else:
+            log.warning("Stable unhealthy after promotion")
+        return healthy
+
+
+def deploy_canary(cfg: DeploymentConfig) -> bool:
+    log.info(f"Canary deploy of {cfg.image} ({cfg.canary_steps}% traffic steps)")
+    if _HAS_K8S and _HAS_ASYNC:
+        return asyncio.run(_deploy_canary_async(cfg))
+    canary = f"{cfg.deployment}-canary"
+    if not _HAS_K8S:
+        set_image(cfg, canary)
+    for weight, (canary_replicas, stable_replicas) in zip(
+        cfg.canary_steps, _canary_schedule(cfg)
+    ):
+        log.info(f"Step {weight}%: canary={canary_replicas} stable={stable_replicas}")
+        if _HAS_K8S:
+            # One SSA patch per deployment carries image + replicas together;
+            # the two deployments are independent, so patch them concurrently.
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                futures = [
+                    ex.submit(apply_deployment, cfg, canary, canary_replicas, cfg.image),
+                    ex.submit(apply_deployment, cfg, cfg.deployment, stable_replicas),
+                ]
+                for future in futures:
+                    future.result()
+            # Unblock the moment the canary is fully available, then bake
+            # only for whatever remains of the configured window.
+            elapsed = wait_until_available(cfg, canary, canary_replicas, cfg.ready_timeout)
+            time.sleep(max(0.0, cfg.bake_seconds - elapsed))
+        else:
+            # The two scales target different deployments; fork both kubectl
+            # processes at once and wait on them together.
+            run_kubectl_parallel(
+                [
+                    [
+                        "scale",
+                        f"deployment/{canary}",
+                        f"--replicas={canary_replicas}",
+                        "-n",
+                        cfg.namespace,
+                    ],
+                    [
+                        "scale",
+                        f"deployment/{cfg.deployment}",
+                        f"--replicas={stable_replicas}",
+                        "-n",
+                        cfg.namespace,
+                    ],
+                ]
+            )
+            _invalidate_health(cfg.namespace, canary)
+            _invalidate_health(cfg.namespace, cfg.deployment)
+            time.sleep(cfg.bake_seconds)
+        if not check_deployment_health(cfg, canary):
+            log.warning(f"Canary unhealthy at {weight}%, rolling back")
+            scale(cfg, canary, 0)
+            scale(cfg, cfg.deployment, cfg.replicas)
+            return False
+    # Bring the stable deployment to full size on the new image and wait for
+    # it to roll out before draining the canary — zeroing the canary while
+    # stable pods are still pulling would leave the Service with no ready
+    # endpoints.
+    if _HAS_K8S:
+        apply_deployment(cfg, cfg.deployment, cfg.replicas, cfg.image)
+    else:
+        set_image(cfg)
+        scale(cfg, cfg.deployment, cfg.replicas)
+    if not wait_for_rollout(cfg):
+        log.warning("Stable rollout failed after promotion; leaving canary serving")
+        return False
+    if _HAS_K8S:
+        apply_deployment(cfg, canary, 0)
+    else:
+        scale(cfg, canary, 0)
+    healthy = check_deployment_health(cfg)
+    if healthy:
+        log.info("Canary promoted to 100%")
+    else:
+        log.warning("Stable unhealthy after promotion")
+    return healthy
+
+
+def deploy_blue_green(cfg: DeploymentConfig) -> bool:
+    service = cfg.deployment
+    if _HAS_K8S:
+        _ensure_client()
+        svc = core.read_namespaced_service(service, cfg.namespace)
+        active = svc.spec.selector.get("version", "blue")
+    else:
+        result = run_kubectl(
+            [
+                "get",
+                "service",
+                service,
+                "-n",
+                cfg.namespace,
+                "-o",
+                "jsonpath={.spec.selector.version}",
+            ]
+        )
+        active = result.stdout.strip() or "blue"
+    target = "green" if active == "blue" else "blue"
+    target_deployment = f"{cfg.deployment}-{target}"
+    log.info(f"Blue/green deploy: {active} -> {target}")
+    set_image(cfg, target_deployment)
+    scale(cfg, target_deployment, cfg.replicas)
+    if not wait_for_rollout(cfg, target_deployment):
+        log.warning(f"{target} rollout failed, keeping traffic on {active}")
+        return False
+    if _HAS_K8S:
+        core.patch_namespaced_service(
+            service, cfg.namespace, {"spec": {"selector": {"version": target}}}
+        )
+    else:
+        run_kubectl(
+            [
+                "patch",
+                "service",
+                service,
+                "-n",
+                cfg.namespace,
+                "-p",
+                _dumps({"spec": {"selector": {"version": target}}}),
+            ]
+        )
+    log.info(f"Traffic switched to {target}, scaling down {active}")
+    scale(cfg, f"{cfg.deployment}-{active}", 0)
+    return True
+
+
+_STRATEGIES = MappingProxyType(
+    {
+        Strategy.ROLLING: deploy_rolling,
+        Strategy.CANARY: deploy_canary,
+        Strategy.BLUE_GREEN: deploy_blue_green,
+    }
+)
+
+
+def deploy(cfg: DeploymentConfig) -> bool:
+    try:
+        strategy = _STRATEGIES[cfg.strategy]
+    except KeyError:
+        raise ValueError(f"unknown deploy strategy: {cfg.strategy!r}") from None
+    try:
+        return strategy(cfg)
+    finally:
+        _flush_log()
+
+
+def run_daemon(socket_path: str) -> int:
+    """Serve deploy requests over a Unix socket, one JSON object per line.
+
+    Keeps the process (and its cached ApiClient) alive across deploys so
+    scripted multi-deploy runs pay kubeconfig parsing and token refresh
+    once instead of once per invocation.
+    """
+    _ensure_client()
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(socket_path)
+        server.listen()
+        log.info(f"deployment_manager daemon listening on {socket_path}")
+        _flush_log()
+        while True:
+            conn, _ = server.accept()
+            # A client that disconnects before reading its response makes
+            # the write/flush below raise (BrokenPipeError et al.); that is
+            # the client's problem, not grounds to kill the daemon.
+            try:
+                with conn, conn.makefile("rw") as stream:
+                    for line in stream:
+                        if not line.strip():
+                            continue
+                        # A bad request (malformed JSON, unknown field,
+                        # invalid strategy) or a failing deploy must not
+                        # take down the daemon; report it to the client
+                        # and keep serving.
+                        try:
+                            request = json.loads(line)
+                            request["strategy"] = Strategy(
+                                request.get("strategy", "rolling")
+                            )
+                            ok = deploy(DeploymentConfig(**request))
+                        except Exception as exc:
+                            log.error(f"daemon request failed: {exc}")
+                            stream.write(f"error: {exc}\n")
+                        else:
+                            stream.write("ok\n" if ok else "failed\n")
+                        stream.flush()
+            except OSError as exc:
+                log.error(f"daemon connection dropped: {exc}")
+                continue
+
+
+def load_manifest(path: str) -> Tuple[List[DeploymentConfig], int]:
+    """Parse a bulk-deploy manifest into configs plus its parallelism cap.
+
+    Expected shape:
+
+        max_parallel: 4
+        deployments:
+          - deployment: app
+            image: repo/app:v2
+            strategy: canary
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise SystemExit(
+            "--from-file requires the PyYAML package "
+            "(pip install -r deploy/requirements.txt)"
+        )
+
+    with open(path) as fh:
+        raw = yaml.safe_load(fh) or {}
+    configs = []
+    for entry in raw.get("deployments", []):
+        entry = dict(entry)
+        entry["strategy"] = Strategy(entry.get("strategy", "rolling"))
+        configs.append(DeploymentConfig(**entry))
+    return configs, int(raw.get("max_parallel", 4))
+
+
+async def _run_bulk(configs: List[DeploymentConfig], max_parallel: int) -> bool:
+    """Fan the deploys out concurrently, bounded by max_parallel.
+
+    Every deploy reuses the one cached ApiClient, so N services cost one
+    process startup and one kubeconfig parse instead of N of each; the
+    semaphore keeps the fan-out from overwhelming the API server.
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def one(cfg: DeploymentConfig) -> bool:
+        async with semaphore:
+            return await asyncio.to_thread(deploy, cfg)
+
+    # One service blowing up (ApiException, missing deployment, ...) must
+    # not abort the others or replace the 0/1 exit code with a traceback.
+    results = await asyncio.gather(
+        *(one(cfg) for cfg in configs), return_exceptions=True
+    )
+    ok = True
+    for cfg, result in zip(configs, results):
+        if isinstance(result, BaseException):
+            log.error(f"deploy of {cfg.deployment} raised: {result}")
+            ok = False
+        elif not result:
+            log.warning(f"deploy of {cfg.deployment} failed")
+            ok = False
+    return ok
+
+
+def run_bulk(path: str) -> int:
+    configs, max_parallel = load_manifest(path)
+    log.info(f"Bulk deploy of {len(configs)} services (max {max_parallel} in flight)")
+    ok = asyncio.run(_run_bulk(configs, max_parallel))
+    _flush_log()
+    return 0 if ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Deploy a service to Kubernetes")
+    parser.add_argument("--daemon", action="store_true")
+    parser.add_argument("--from-file", help="bulk-deploy manifest (YAML)")
+    parser.add_argument("--socket", default="/tmp/deployment_manager.sock")
+    parser.add_argument("--deployment")
+    parser.add_argument("--image")
+    parser.add_argument("--namespace", default="default")
+    parser.add_argument("--replicas", type=int, default=3)
+    parser.add_argument(
+        "--strategy",
+        choices=[s.value for s in Strategy],
+        default=Strategy.ROLLING.value,
+    )
+    parser.add_argument("--timeout", type=int, default=300)
+    parser.add_argument("--bake-seconds", type=int, default=60)
+    args = parser.parse_args()
+    if args.daemon:
+        return run_daemon(args.socket)
+    if args.from_file:
+        return run_bulk(args.from_file)
+    if not args.deployment or not args.image:
+        parser.error(
+            "--deployment and --image are required unless --daemon or "
+            "--from-file is set"
+        )
+    cfg = DeploymentConfig(
+        deployment=args.deployment,
+        image=args.image,
+        namespace=args.namespace,
+        replicas=args.replicas,
+        strategy=Strategy(args.strategy),
+        timeout_seconds=args.timeout,
+        bake_seconds=args.bake_seconds,
+    )
+    return 0 if deploy(cfg) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+CI pipeline generator.
+
+Renders a CI configuration (GitHub Actions, GitLab CI, or Jenkins) for a
+project, detecting the package manager from the lockfile present. The
+templates are compiled into string.Template instances once at module
+import, so repeated generation — e.g. batch-scaffolding many services —
+does not re-parse the placeholder grammar on every call.
+
+Usage:
+    python pipeline_generator.py --platform github --project . \
+        --output .github/workflows/ci.yml
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import textwrap
+from logging.handlers import MemoryHandler
+from pathlib import Path
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+log = logging.getLogger("pipeline")
+if not log.handlers:
+    log.addHandler(
+        MemoryHandler(
+            capacity=256, flushLevel=logging.ERROR, target=logging.StreamHandler()
+        )
+    )
+    log.setLevel(logging.INFO)
+
+
+def _flush_log() -> None:
+    for handler in log.handlers:
+        handler.flush()
+
+
+GITHUB_ACTIONS_TEMPLATE = Template(
+    textwrap.dedent(
+        """\
+name: CI
+
+on:
+  push:
+    branches: [main]
+  pull_request:
+
+jobs:
+  build:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+      - uses: actions/setup-node@v4
+        with:
+          node-version: "$node_version"
+      - name: Install dependencies
+        run: $install_cmd
+      - name: Build
+        run: $build_cmd
+      - name: Test
+        run: $test_cmd
+"""
+    )
+)
+
+GITLAB_CI_TEMPLATE = Template(
+    textwrap.dedent(
+        """\
+image: node:$node_version
+
+stages:
+  - build
+  - test
+
+build:
+  stage: build
+  script:
+    - $install_cmd
+    - $build_cmd
+
+test:
+  stage: test
+  script:
+    - $install_cmd
+    - $test_cmd
+"""
+    )
+)
+
+JENKINS_TEMPLATE = Template(
+    textwrap.dedent(
+        """\
+pipeline {
+    agent { docker { image 'node:$node_version' } }
+    stages {
+        stage('Install') {
+            steps { sh '$install_cmd' }
+        }
+        stage('Build') {
+            steps { sh '$build_cmd' }
+        }
+        stage('Test') {
+            steps { sh '$test_cmd' }
+        }
+    }
+}
+"""
+    )
+)
+
+TEMPLATES: Dict[str, Template] = {
+    "github": GITHUB_ACTIONS_TEMPLATE,
+    "gitlab": GITLAB_CI_TEMPLATE,
+    "jenkins": JENKINS_TEMPLATE,
+}
+
+
+NPM_CFG = MappingProxyType(
+    {
+        "package_manager": "npm",
+        "install_cmd": "npm ci",
+        "build_cmd": "npm run build",
+        "test_cmd": "npm test",
+    }
+)
+
+PNPM_CFG = MappingProxyType(
+    {
+        "package_manager": "pnpm",
+        "install_cmd": "pnpm install --frozen-lockfile",
+        "build_cmd": "pnpm build",
+        "test_cmd": "pnpm test",
+    }
+)
+
+YARN_CFG = MappingProxyType(
+    {
+        "package_manager": "yarn",
+        "install_cmd": "yarn install --frozen-lockfile",
+        "build_cmd": "yarn build",
+        "test_cmd": "yarn test",
+    }
+)
+
+BUN_CFG = MappingProxyType(
+    {
+        "package_manager": "bun",
+        "install_cmd": "bun install",
+        "build_cmd": "bun run build",
+        "test_cmd": "bun test",
+    }
+)
+
+LOCKFILE_CONFIGS = (
+    ("pnpm-lock.yaml", PNPM_CFG),
+    ("yarn.lock", YARN_CFG),
+    ("bun.lockb", BUN_CFG),
+)
+
+
+def detect_project_type(project_path: Path) -> Mapping[str, str]:
+    """Infer the package manager and its commands from the lockfile.
+
+    One directory scan replaces a stat call per candidate lockfile, and the
+    returned config is a shared immutable table entry rather than a fresh
+    dict per call.
+    """
+    entries = {entry.name for entry in os.scandir(project_path)}
+    for lockfile, config in LOCKFILE_CONFIGS:
+        if lockfile in entries:
+            return config
+    return NPM_CFG
+
+
+def generate_pipeline(
+    platform: str, project_path: Path, output: Path, node_version: str = "20"
+) -> None:
+    """Render the CI config for `platform` and write it to `output`.
+
+    Skips the write when the rendered content matches what is already on
+    disk, so regeneration loops leave the mtime alone and downstream CI
+    does not re-trigger on an unchanged file.
+    """
+    config = dict(detect_project_type(project_path), node_version=node_version)
+    rendered = TEMPLATES[platform].substitute(config).encode("utf-8")
+    if output.exists():
+        digest = hashlib.blake2b(rendered, digest_size=16).digest()
+        existing = hashlib.blake2b(output.read_bytes(), digest_size=16).digest()
+        if digest == existing:
+            log.info(f"{output} already up to date, skipping write")
+            _flush_log()
+            return
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(rendered)
+    log.info(f"Wrote {platform} pipeline to {output}")
+    _flush_log()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a CI pipeline config")
+    parser.add_argument("--platform", choices=sorted(TEMPLATES), default="github")
+    parser.add_argument("--project", type=Path, default=Path("."))
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--node-version", default="20")
+    args = parser.parse_args()
+    generate_pipeline(args.platform, args.project, args.output, args.node_version)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+variable "name" {
+  type        = string
+  description = "Name prefix for all resources"
+}
+
+variable "vpc_cidr" {
+  type        = string
+  description = "CIDR block for the VPC"
+  default     = "10.0.0.0/16"
+}
+
+variable "availability_zones" {
+  type        = list(string)
+  description = "Availability zones to spread subnets across"
+}
@@ -0,0 +1,14 @@
+resource "azurerm_virtual_network" "main" {
+  name                = var.name
+  location            = var.location
+  resource_group_name = var.resource_group_name
+  address_space       = [var.vnet_cidr]
+}
+
+resource "azurerm_subnet" "main" {
+  count                = length(var.subnet_cidrs)
+  name                 = "${var.name}-${count.index}"
+  resource_group_name  = var.resource_group_name
+  virtual_network_name = azurerm_virtual_network.main.name
+  address_prefixes     = [var.subnet_cidrs[count.index]]
+}
@@ -0,0 +1,7 @@
+output "vnet_id" {
+  value = azurerm_virtual_network.main.id
+}
+
+output "subnet_ids" {
+  value = azurerm_subnet.main[*].id
+}
@@ -0,0 +1,25 @@
+variable "name" {
+  type        = string
+  description = "Name prefix for all resources"
+}
+
+variable "location" {
+  type        = string
+  description = "Azure region"
+}
+
+variable "resource_group_name" {
+  type        = string
+  description = "Resource group to create the network in"
+}
+
+variable "vnet_cidr" {
+  type        = string
+  description = "Address space for the virtual network"
+  default     = "10.0.0.0/16"
+}
+
+variable "subnet_cidrs" {
+  type        = list(string)
+  description = "Address prefix per subnet"
+}
@@ -0,0 +1,12 @@
+resource "google_compute_network" "main" {
+  name                    = var.name
+  auto_create_subnetworks = false
+}
+
+resource "google_compute_subnetwork" "main" {
+  count         = length(var.regions)
+  name          = "${var.name}-${count.index}"
+  network       = google_compute_network.main.id
+  region        = var.regions[count.index]
+  ip_cidr_range = var.subnet_cidrs[count.index]
+}
@@ -0,0 +1,7 @@
+output "network_id" {
+  value = google_compute_network.main.id
+}
+
+output "subnetwork_ids" {
+  value = google_compute_subnetwork.main[*].id
+}
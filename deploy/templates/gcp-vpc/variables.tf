@@ -0,0 +1,14 @@
+variable "name" {
+  type        = string
+  description = "Name prefix for all resources"
+}
+
+variable "regions" {
+  type        = list(string)
+  description = "Regions to create subnetworks in"
+}
+
+variable "subnet_cidrs" {
+  type        = list(string)
+  description = "CIDR range per subnetwork"
+}
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Terraform module scaffolder.
+
+Generates a ready-to-plan Terraform module (currently VPC networking) for
+AWS, GCP, or Azure. The provider templates contain no per-call variables,
+so the full (provider, module_type) bundles are rendered once at module
+import and scaffold_module only has to write them out.
+
+Usage:
+    python terraform_scaffolder.py --provider aws --name core-vpc \
+        --output infra/modules/core-vpc
+"""
+
+import argparse
+import hashlib
+import ipaddress
+import logging
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+log = logging.getLogger("scaffold")
+if not log.handlers:
+    log.addHandler(
+        MemoryHandler(
+            capacity=256, flushLevel=logging.ERROR, target=logging.StreamHandler()
+        )
+    )
+    log.setLevel(logging.INFO)
+
+
+def _flush_log() -> None:
+    for handler in log.handlers:
+        handler.flush()
+
+
+AWS_VPC_MAIN = """\
+resource "aws_vpc" "main" {
+  cidr_block           = var.vpc_cidr
+  enable_dns_support   = true
+  enable_dns_hostnames = true
+
+  tags = {
+    Name = var.name
+  }
+}
+
+resource "aws_subnet" "public" {
+  count             = length(var.availability_zones)
+  vpc_id            = aws_vpc.main.id
+  cidr_block        = cidrsubnet(var.vpc_cidr, 4, count.index)
+  availability_zone = var.availability_zones[count.index]
+
+  tags = {
+    Name = "${var.name}-public-${count.index}"
+  }
+}
+
+resource "aws_subnet" "private" {
+  count             = length(var.availability_zones)
+  vpc_id            = aws_vpc.main.id
+  cidr_block        = cidrsubnet(var.vpc_cidr, 4, count.index + length(var.availability_zones))
+  availability_zone = var.availability_zones[count.index]
+
+  tags = {
+    Name = "${var.name}-private-${count.index}"
+  }
+}
+
+resource "aws_internet_gateway" "main" {
+  vpc_id = aws_vpc.main.id
+}
+"""
+
+AWS_VPC_VARIABLES = """\
+variable "name" {
+  type        = string
+  description = "Name prefix for all resources"
+}
+
+variable "vpc_cidr" {
+  type        = string
+  description = "CIDR block for the VPC"
+  default     = "10.0.0.0/16"
+}
+
+variable "availability_zones" {
+  type        = list(string)
+  description = "Availability zones to spread subnets across"
+}
+"""
+
+AWS_VPC_OUTPUTS = """\
+output "vpc_id" {
+  value = aws_vpc.main.id
+}
+
+output "public_subnet_ids" {
+  value = aws_subnet.public[*].id
+}
+
+output "private_subnet_ids" {
+  value = aws_subnet.private[*].id
+}
+"""
+
+GCP_VPC_MAIN = """\
+resource "google_compute_network" "main" {
+  name                    = var.name
+  auto_create_subnetworks = false
+}
+
+resource "google_compute_subnetwork" "main" {
+  count         = length(var.regions)
+  name          = "${var.name}-${count.index}"
+  network       = google_compute_network.main.id
+  region        = var.regions[count.index]
+  ip_cidr_range = var.subnet_cidrs[count.index]
+}
+"""
+
+GCP_VPC_VARIABLES = """\
+variable "name" {
+  type        = string
+  description = "Name prefix for all resources"
+}
+
+variable "regions" {
+  type        = list(string)
+  description = "Regions to create subnetworks in"
+}
+
+variable "subnet_cidrs" {
+  type        = list(string)
+  description = "CIDR range per subnetwork"
+}
+"""
+
+GCP_VPC_OUTPUTS = """\
+output "network_id" {
+  value = google_compute_network.main.id
+}
+
+output "subnetwork_ids" {
+  value = google_compute_subnetwork.main[*].id
+}
+"""
+
+AZURE_VPC_MAIN = """\
+resource "azurerm_virtual_network" "main" {
+  name                = var.name
+  location            = var.location
+  resource_group_name = var.resource_group_name
+  address_space       = [var.vnet_cidr]
+}
+
+resource "azurerm_subnet" "main" {
+  count                = length(var.subnet_cidrs)
+  name                 = "${var.name}-${count.index}"
+  resource_group_name  = var.resource_group_name
+  virtual_network_name = azurerm_virtual_network.main.name
+  address_prefixes     = [var.subnet_cidrs[count.index]]
+}
+"""
+
+AZURE_VPC_VARIABLES = """\
+variable "name" {
+  type        = string
+  description = "Name prefix for all resources"
+}
+
+variable "location" {
+  type        = string
+  description = "Azure region"
+}
+
+variable "resource_group_name" {
+  type        = string
+  description = "Resource group to create the network in"
+}
+
+variable "vnet_cidr" {
+  type        = string
+  description = "Address space for the virtual network"
+  default     = "10.0.0.0/16"
+}
+
+variable "subnet_cidrs" {
+  type        = list(string)
+  description = "Address prefix per subnet"
+}
+"""
+
+AZURE_VPC_OUTPUTS = """\
+output "vnet_id" {
+  value = azurerm_virtual_network.main.id
+}
+
+output "subnet_ids" {
+  value = azurerm_subnet.main[*].id
+}
+"""
+
+README_TEMPLATE = """\
+# {name}
+
+Terraform {module_type} module for {provider}, generated by
+terraform_scaffolder.py. Review variables.tf for required inputs before
+running `terraform plan`.
+"""
+
+# Rendered bundles keyed by (provider, module_type). The templates carry no
+# per-call variables, so scaffold_module just writes these out verbatim.
+RENDERED_MODULES: Dict[Tuple[str, str], Dict[str, str]] = {
+    ("aws", "vpc"): {
+        "main.tf": AWS_VPC_MAIN,
+        "variables.tf": AWS_VPC_VARIABLES,
+        "outputs.tf": AWS_VPC_OUTPUTS,
+    },
+    ("gcp", "vpc"): {
+        "main.tf": GCP_VPC_MAIN,
+        "variables.tf": GCP_VPC_VARIABLES,
+        "outputs.tf": GCP_VPC_OUTPUTS,
+    },
+    ("azure", "vpc"): {
+        "main.tf": AZURE_VPC_MAIN,
+        "variables.tf": AZURE_VPC_VARIABLES,
+        "outputs.tf": AZURE_VPC_OUTPUTS,
+    },
+}
+
+
+# Bundles rendered ahead of time by render_template_bundles; when present,
+# scaffolding is a kernel-side file copy instead of a Python write.
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+
+def render_template_bundles(dest: Path = TEMPLATES_DIR) -> None:
+    """Render every (provider, module_type) bundle to disk.
+
+    Run at build time (or after editing a template) so scaffold_module can
+    copy the files instead of writing template strings out per call.
+    """
+    for (provider, module_type), bundle in RENDERED_MODULES.items():
+        bundle_dir = dest / f"{provider}-{module_type}"
+        bundle_dir.mkdir(parents=True, exist_ok=True)
+        for filename, content in bundle.items():
+            (bundle_dir / filename).write_text(content)
+
+
+def _bake_subnet_cidrs(bundle: Dict[str, str], vpc_cidr: str) -> Dict[str, str]:
+    """Fold the cidrsubnet() calls into static locals for a known VPC CIDR.
+
+    When the CIDR is fixed at scaffold time, computing the subnet ranges
+    here and emitting them as a list literal saves Terraform re-evaluating
+    cidrsubnet() on every plan and apply. The single list is indexed with
+    the template's own offsets (private subnets start after one slot per
+    availability zone), so baked output allocates exactly the same ranges
+    as the unbaked template, and a validation block pins var.vpc_cidr so
+    an override at plan time fails instead of silently producing subnets
+    outside the VPC.
+    """
+    subnets = ", ".join(
+        f'"{s}"' for s in ipaddress.ip_network(vpc_cidr).subnets(prefixlen_diff=4)
+    )
+    locals_block = f"locals {{\n  subnet_cidrs = [{subnets}]\n}}\n\n"
+    main_tf = locals_block + bundle["main.tf"]
+    main_tf = main_tf.replace(
+        "cidrsubnet(var.vpc_cidr, 4, count.index + length(var.availability_zones))",
+        "local.subnet_cidrs[count.index + length(var.availability_zones)]",
+    ).replace(
+        "cidrsubnet(var.vpc_cidr, 4, count.index)",
+        "local.subnet_cidrs[count.index]",
+    )
+    variables_tf = bundle["variables.tf"].replace(
+        """variable "vpc_cidr" {
+  type        = string
+  description = "CIDR block for the VPC"
+  default     = "10.0.0.0/16"
+}""",
+        f"""variable "vpc_cidr" {{
+  type        = string
+  description = "CIDR block for the VPC (fixed at scaffold time)"
+  default     = "{vpc_cidr}"
+
+  validation {{
+    condition     = var.vpc_cidr == "{vpc_cidr}"
+    error_message = "Subnet CIDRs were baked for {vpc_cidr} at scaffold time; re-run the scaffolder to change the VPC CIDR."
+  }}
+}}""",
+    )
+    return dict(bundle, **{"main.tf": main_tf, "variables.tf": variables_tf})
+
+
+def _bundle_fresh(bundle_dir: Path, bundle: Dict[str, str]) -> bool:
+    """True when every on-disk bundle file matches its in-memory template."""
+    for filename, content in bundle.items():
+        try:
+            on_disk = (bundle_dir / filename).read_bytes()
+        except OSError:
+            return False
+        digest = hashlib.blake2b(on_disk, digest_size=16).digest()
+        if digest != hashlib.blake2b(content.encode(), digest_size=16).digest():
+            return False
+    return True
+
+
+def scaffold_module(
+    provider: str,
+    module_type: str,
+    name: str,
+    module_path: Path,
+    vpc_cidr: Optional[str] = None,
+) -> None:
+    """Write the pre-rendered module bundle plus a README into module_path."""
+    bundle = RENDERED_MODULES[(provider, module_type)]
+    bundle_dir = TEMPLATES_DIR / f"{provider}-{module_type}"
+    use_bundle_dir = bundle_dir.is_dir()
+    if use_bundle_dir and not _bundle_fresh(bundle_dir, bundle):
+        # A template constant changed without re-running --render-bundles;
+        # never silently ship the stale files.
+        log.warning(
+            f"{bundle_dir} is stale; writing from the in-memory templates "
+            "(re-run --render-bundles to refresh it)"
+        )
+        use_bundle_dir = False
+    if vpc_cidr is not None and provider == "aws":
+        # Baked output differs from the shipped bundle, so take the
+        # write-from-memory path below.
+        bundle = _bake_subnet_cidrs(bundle, vpc_cidr)
+        use_bundle_dir = False
+    module_path.mkdir(parents=True, exist_ok=True)
+    readme = README_TEMPLATE.format(
+        name=name, module_type=module_type, provider=provider
+    )
+    # The four files are independent, so overlap their open/write/close
+    # cycles instead of paying each one's syscall latency serially. When
+    # the on-disk bundle exists, the .tf files are copied kernel-side
+    # (shutil uses sendfile/copy_file_range) with no Python string I/O.
+    with ThreadPoolExecutor(max_workers=len(bundle) + 1) as ex:
+        if use_bundle_dir:
+            futures = [
+                ex.submit(
+                    shutil.copyfile, bundle_dir / filename, module_path / filename
+                )
+                for filename in bundle
+            ]
+        else:
+            futures = [
+                ex.submit((module_path / filename).write_text, content)
+                for filename, content in bundle.items()
+            ]
+        futures.append(ex.submit((module_path / "README.md").write_text, readme))
+        for future in futures:
+            future.result()
+    log.info(f"Scaffolded {provider}/{module_type} module at {module_path}")
+    _flush_log()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scaffold a Terraform module")
+    parser.add_argument(
+        "--provider", choices=sorted({p for p, _ in RENDERED_MODULES}), default="aws"
+    )
+    parser.add_argument("--module-type", default="vpc")
+    parser.add_argument("--name")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument(
+        "--vpc-cidr",
+        help="bake subnet CIDRs for this VPC CIDR into the rendered module (aws)",
+    )
+    parser.add_argument(
+        "--render-bundles",
+        action="store_true",
+        help="re-render the on-disk template bundles and exit",
+    )
+    args = parser.parse_args()
+    if args.render_bundles:
+        render_template_bundles()
+        return 0
+    if not args.name or not args.output:
+        parser.error("--name and --output are required unless --render-bundles is set")
+    scaffold_module(
+        args.provider, args.module_type, args.name, args.output, args.vpc_cidr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import deployment_manager as dm
+
+
+def make_deployment(
+    generation=3,
+    observed_generation=3,
+    desired=3,
+    updated=3,
+    replicas=3,
+    available=3,
+    ready=3,
+    conditions=(),
+):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(generation=generation),
+        spec=SimpleNamespace(replicas=desired),
+        status=SimpleNamespace(
+            observed_generation=observed_generation,
+            updated_replicas=updated,
+            replicas=replicas,
+            available_replicas=available,
+            ready_replicas=ready,
+            conditions=list(conditions),
+        ),
+    )
+
+
+PROGRESS_DEADLINE = SimpleNamespace(
+    type="Progressing", reason="ProgressDeadlineExceeded"
+)
+
+
+class TestComputeStatus:
+    def test_fully_rolled_out_is_current(self):
+        assert dm.compute_status(make_deployment()) is dm.RolloutStatus.CURRENT
+
+    def test_stale_observed_generation_is_in_progress(self):
+        dep = make_deployment(generation=4, observed_generation=3)
+        assert dm.compute_status(dep) is dm.RolloutStatus.IN_PROGRESS
+
+    def test_stale_generation_wins_over_failed_condition(self):
+        # kstatus checks generation before conditions: a stale status must
+        # not be trusted even if it carries a failure condition.
+        dep = make_deployment(
+            generation=4, observed_generation=3, conditions=[PROGRESS_DEADLINE]
+        )
+        assert dm.compute_status(dep) is dm.RolloutStatus.IN_PROGRESS
+
+    def test_progress_deadline_exceeded_is_failed(self):
+        dep = make_deployment(updated=1, available=1, conditions=[PROGRESS_DEADLINE])
+        assert dm.compute_status(dep) is dm.RolloutStatus.FAILED
+
+    def test_lagging_updated_replicas_is_in_progress(self):
+        dep = make_deployment(updated=2)
+        assert dm.compute_status(dep) is dm.RolloutStatus.IN_PROGRESS
+
+    def test_old_replicas_still_terminating_is_in_progress(self):
+        dep = make_deployment(replicas=4)
+        assert dm.compute_status(dep) is dm.RolloutStatus.IN_PROGRESS
+
+    def test_lagging_available_replicas_is_in_progress(self):
+        dep = make_deployment(available=2)
+        assert dm.compute_status(dep) is dm.RolloutStatus.IN_PROGRESS
+
+    def test_lagging_ready_replicas_is_in_progress(self):
+        dep = make_deployment(ready=2)
+        assert dm.compute_status(dep) is dm.RolloutStatus.IN_PROGRESS
+
+    def test_none_counters_treated_as_zero(self):
+        dep = make_deployment(
+            observed_generation=None,
+            updated=None,
+            replicas=None,
+            available=None,
+            ready=None,
+        )
+        assert dm.compute_status(dep) is dm.RolloutStatus.IN_PROGRESS
+
+
+class TestCanarySchedule:
+    def test_default_steps(self):
+        cfg = dm.DeploymentConfig("app", "img:v1", replicas=6)
+        assert dm._canary_schedule(cfg) == [(1, 5), (1, 5), (3, 3), (4, 2), (6, 0)]
+
+    def test_small_weight_keeps_one_canary_replica(self):
+        cfg = dm.DeploymentConfig("app", "img:v1", replicas=3, canary_steps=[1])
+        assert dm._canary_schedule(cfg) == [(1, 2)]
+
+    def test_weight_over_100_is_rejected(self):
+        cfg = dm.DeploymentConfig("app", "img:v1", replicas=3, canary_steps=[10, 150])
+        with pytest.raises(ValueError):
+            dm._canary_schedule(cfg)
+
+
+class TestHealthCache:
+    def setup_method(self):
+        dm._health_cache.clear()
+
+    def test_fresh_entry_is_returned_without_a_query(self):
+        cfg = dm.DeploymentConfig("app", "img:v1")
+        dm._health_cache[("default", "app")] = (time.monotonic(), True)
+        assert dm.check_deployment_health(cfg) is True
+
+    def test_invalidate_drops_the_entry(self):
+        dm._health_cache[("default", "app")] = (time.monotonic(), True)
+        dm._invalidate_health("default", "app")
+        assert ("default", "app") not in dm._health_cache
+
+    def test_invalidate_missing_entry_is_a_noop(self):
+        dm._invalidate_health("default", "absent")
+
+
+def test_dumps_is_compact_and_escapes():
+    assert dm._dumps({"spec": {"selector": {"version": "green"}}}) == (
+        '{"spec":{"selector":{"version":"green"}}}'
+    )
+
+
+def test_unknown_strategy_raises_value_error():
+    cfg = dm.DeploymentConfig("app", "img:v1", strategy="not-a-strategy")
+    with pytest.raises(ValueError):
+        dm.deploy(cfg)
@@ -0,0 +1,52 @@
+import pytest
+
+import pipeline_generator as pg
+
+
+class TestDetectProjectType:
+    def test_pnpm_lockfile(self, tmp_path):
+        (tmp_path / "pnpm-lock.yaml").touch()
+        assert dict(pg.detect_project_type(tmp_path)) == dict(pg.PNPM_CFG)
+
+    def test_yarn_lockfile(self, tmp_path):
+        (tmp_path / "yarn.lock").touch()
+        assert dict(pg.detect_project_type(tmp_path)) == dict(pg.YARN_CFG)
+
+    def test_bun_lockfile(self, tmp_path):
+        (tmp_path / "bun.lockb").touch()
+        assert dict(pg.detect_project_type(tmp_path)) == dict(pg.BUN_CFG)
+
+    def test_defaults_to_npm(self, tmp_path):
+        assert pg.detect_project_type(tmp_path) is pg.NPM_CFG
+
+    def test_pnpm_wins_over_yarn(self, tmp_path):
+        (tmp_path / "pnpm-lock.yaml").touch()
+        (tmp_path / "yarn.lock").touch()
+        assert pg.detect_project_type(tmp_path) is pg.PNPM_CFG
+
+    def test_returned_config_is_immutable(self, tmp_path):
+        config = pg.detect_project_type(tmp_path)
+        with pytest.raises(TypeError):
+            config["install_cmd"] = "rm -rf /"
+
+
+class TestGeneratePipeline:
+    def test_renders_without_leftover_placeholders(self, tmp_path):
+        output = tmp_path / "ci.yml"
+        pg.generate_pipeline("github", tmp_path, output)
+        rendered = output.read_text()
+        assert "$" not in rendered
+        assert "npm ci" in rendered
+
+    def test_skips_write_when_content_unchanged(self, tmp_path):
+        output = tmp_path / "ci.yml"
+        pg.generate_pipeline("gitlab", tmp_path, output)
+        before = output.stat().st_mtime_ns
+        pg.generate_pipeline("gitlab", tmp_path, output)
+        assert output.stat().st_mtime_ns == before
+
+    def test_rewrites_when_content_changes(self, tmp_path):
+        output = tmp_path / "ci.yml"
+        pg.generate_pipeline("github", tmp_path, output)
+        pg.generate_pipeline("github", tmp_path, output, node_version="22")
+        assert 'node-version: "22"' in output.read_text()
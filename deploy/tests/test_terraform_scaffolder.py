@@ -0,0 +1,88 @@
+import ipaddress
+import re
+
+import terraform_scaffolder as ts
+
+
+def cidrsubnet(cidr, newbits, netnum):
+    """Terraform's cidrsubnet() for the subset of inputs the template uses."""
+    return str(list(ipaddress.ip_network(cidr).subnets(prefixlen_diff=newbits))[netnum])
+
+
+class TestBakeSubnetCidrs:
+    CIDR = "10.42.0.0/16"
+
+    def bake(self):
+        return ts._bake_subnet_cidrs(ts.RENDERED_MODULES[("aws", "vpc")], self.CIDR)
+
+    def test_no_cidrsubnet_calls_remain(self):
+        assert "cidrsubnet" not in self.bake()["main.tf"]
+
+    def test_baked_list_is_address_equivalent(self):
+        # The baked locals must contain exactly the ranges Terraform would
+        # compute, in netnum order, so that indexing with the template's
+        # own offsets yields identical allocations for any AZ count.
+        main_tf = self.bake()["main.tf"]
+        match = re.search(r"subnet_cidrs = \[(.*?)\]", main_tf)
+        baked = [c.strip().strip('"') for c in match.group(1).split(",")]
+        assert baked == [cidrsubnet(self.CIDR, 4, i) for i in range(16)]
+
+    def test_private_offset_matches_template(self):
+        main_tf = self.bake()["main.tf"]
+        assert (
+            "local.subnet_cidrs[count.index + length(var.availability_zones)]"
+            in main_tf
+        )
+        assert "local.subnet_cidrs[count.index]" in main_tf
+
+    def test_vpc_cidr_variable_is_pinned(self):
+        variables_tf = self.bake()["variables.tf"]
+        assert f'default     = "{self.CIDR}"' in variables_tf
+        assert f'condition     = var.vpc_cidr == "{self.CIDR}"' in variables_tf
+
+
+class TestScaffoldModule:
+    def test_fresh_bundle_is_copied_verbatim(self, tmp_path, monkeypatch):
+        bundles = tmp_path / "bundles"
+        ts.render_template_bundles(bundles)
+        monkeypatch.setattr(ts, "TEMPLATES_DIR", bundles)
+        ts.scaffold_module("aws", "vpc", "core", tmp_path / "mod")
+        assert (tmp_path / "mod" / "main.tf").read_text() == ts.AWS_VPC_MAIN
+        assert "# core" in (tmp_path / "mod" / "README.md").read_text()
+
+    def test_stale_bundle_falls_back_to_memory(self, tmp_path, monkeypatch):
+        bundles = tmp_path / "bundles"
+        ts.render_template_bundles(bundles)
+        (bundles / "aws-vpc" / "main.tf").write_text("# drifted\n")
+        monkeypatch.setattr(ts, "TEMPLATES_DIR", bundles)
+        ts.scaffold_module("aws", "vpc", "core", tmp_path / "mod")
+        assert (tmp_path / "mod" / "main.tf").read_text() == ts.AWS_VPC_MAIN
+
+    def test_missing_bundle_writes_from_memory(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ts, "TEMPLATES_DIR", tmp_path / "nowhere")
+        ts.scaffold_module("gcp", "vpc", "net", tmp_path / "mod")
+        assert (tmp_path / "mod" / "main.tf").read_text() == ts.GCP_VPC_MAIN
+
+    def test_baked_module_skips_the_bundle(self, tmp_path, monkeypatch):
+        bundles = tmp_path / "bundles"
+        ts.render_template_bundles(bundles)
+        monkeypatch.setattr(ts, "TEMPLATES_DIR", bundles)
+        ts.scaffold_module("aws", "vpc", "core", tmp_path / "mod", "10.0.0.0/16")
+        main_tf = (tmp_path / "mod" / "main.tf").read_text()
+        assert "cidrsubnet" not in main_tf
+        assert "10.0.240.0/20" in main_tf
+
+
+class TestBundleFresh:
+    def test_matching_bundle_is_fresh(self, tmp_path):
+        bundle = {"main.tf": "content\n"}
+        (tmp_path / "main.tf").write_text("content\n")
+        assert ts._bundle_fresh(tmp_path, bundle)
+
+    def test_drifted_file_is_stale(self, tmp_path):
+        bundle = {"main.tf": "content\n"}
+        (tmp_path / "main.tf").write_text("other\n")
+        assert not ts._bundle_fresh(tmp_path, bundle)
+
+    def test_missing_file_is_stale(self, tmp_path):
+        assert not ts._bundle_fresh(tmp_path, {"main.tf": "content\n"})